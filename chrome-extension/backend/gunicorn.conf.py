@@ -0,0 +1,13 @@
+import gc
+
+# gunicorn config - run with: gunicorn server:app (from this folder)
+bind = "0.0.0.0:5050"
+workers = 2
+
+# import server.py (and build the vader lexicon) once in the master,
+# forked workers then share it instead of each loading their own copy
+preload_app = True
+
+def when_ready(server):
+    """move preloaded objects out of gc tracking - avoids copy-on-write in workers"""
+    gc.freeze()
@@ -5,6 +5,7 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 # setup flask app
 app = Flask(__name__)
 CORS(app)  # allow cross-origin requests
+# built at import so gunicorn (preload_app) loads the lexicon once, before forking workers
 analyzer = SentimentIntensityAnalyzer()
 
 @app.route('/analyze', methods=['POST', 'OPTIONS'])
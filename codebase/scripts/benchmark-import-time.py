@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# heavy third-party modules each script used to import at module load
+HEAVY_IMPORTS = {
+    "collect-reels.py": ["selenium.webdriver"],
+    "collect-reel-data.py": ["selenium.webdriver", "bs4"],
+    "create-visualisation-module.py": ["plotly.express", "pandas"],
+    "vader-sentiment-analysis.py": ["vaderSentiment.vaderSentiment", "langdetect"],
+}
+
+# runs in a fresh interpreter: load script as a module (no __main__ block) and report
+LOAD_SCRIPT = """
+import importlib.util, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("script", sys.argv[1])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+elapsed = time.perf_counter() - start
+heavy = [m for m in sys.argv[2:] if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+# runs in a fresh interpreter: eagerly import the heavy modules (old behaviour)
+LOAD_EAGER = """
+import importlib, sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+print(time.perf_counter() - start)
+"""
+
+
+class ImportBenchmark:
+    """compares script import time against eagerly importing heavy modules"""
+
+    def __init__(self, runs=5):
+        """set number of fresh interpreter runs per measurement"""
+        self.runs = runs
+
+    def time_run(self, code, args):
+        """run code in a fresh interpreter, return its stdout"""
+        out = subprocess.run(
+            [sys.executable, "-c", code, *args],
+            capture_output=True, text=True, check=True
+        )
+        return out.stdout.split()
+
+    def best_of(self, code, args):
+        """best time (and extra output) over several runs"""
+        results = [self.time_run(code, args) for _ in range(self.runs)]
+        best = min(results, key=lambda r: float(r[0]))
+        return float(best[0]), best[1:]
+
+    def run_benchmark(self):
+        """main function to run benchmark"""
+        print(f"{'script':<34}{'lazy (ms)':>12}{'eager (ms)':>12}  heavy modules loaded")
+        for script, heavy in HEAVY_IMPORTS.items():
+            lazy, loaded = self.best_of(LOAD_SCRIPT, [str(SCRIPTS_DIR / script), *heavy])
+            try:
+                eager, _ = self.best_of(LOAD_EAGER, heavy)
+                eager_ms = f"{eager * 1000:.1f}"
+            except subprocess.CalledProcessError:
+                eager_ms = "n/a"  # dependency not installed
+            print(f"{script:<34}{lazy * 1000:>12.1f}{eager_ms:>12}  {loaded[0] if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    benchmark = ImportBenchmark(runs=5)
+    benchmark.run_benchmark()
@@ -4,13 +4,7 @@ import random
 import os
 import re
 from datetime import datetime
-from selenium import webdriver
-from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+# selenium and bs4 are imported inside the methods that use them - keeps startup fast
 
 class ReelDataCollector:
     """collects likes, comments and metadata for reels"""
@@ -28,6 +22,9 @@ class ReelDataCollector:
     
     def get_driver(self, headless=True):
         """setup chrome browser"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         options = Options()
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-dev-shm-usage")
@@ -61,6 +58,8 @@ class ReelDataCollector:
     
     def extract_meta_data(self, html):
         """get likes, comments, date from html"""
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, 'html.parser')
         meta = soup.find('meta', attrs={'name': 'description'})
         
@@ -81,6 +80,11 @@ class ReelDataCollector:
     
     def load_all_comments(self, driver):
         """load and collect comments"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import StaleElementReferenceException
+
         comments_dict = {}
         attempts = 0
         last_count = 0
@@ -140,6 +144,10 @@ class ReelDataCollector:
     
     def process_reel_in_tab(self, driver, tab_index, reel_url):
         """process one reel in browser tab"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         try:
             driver.switch_to.window(driver.window_handles[tab_index])
             driver.get(reel_url)
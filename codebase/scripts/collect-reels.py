@@ -2,11 +2,7 @@ import json
 import time
 # import sys
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# selenium is imported inside get_reels_with_scroll - keeps startup fast
 
 class ReelLinkCollector:
     """collects reel urls from target page"""
@@ -34,6 +30,10 @@ class ReelLinkCollector:
     
     def get_reels_with_scroll(self):
         """scroll page and collect reel links"""
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+
         driver = webdriver.Chrome()
         driver.get("https://www.instagram.com/pubity/reels/")
         
@@ -1,6 +1,5 @@
 import json
-import plotly.express as px
-import pandas as pd
+# plotly and pandas are imported inside the methods that use them - keeps startup fast
 
 class ReelVisualizer:
     """creates visualization of reel data"""
@@ -12,6 +11,8 @@ class ReelVisualizer:
     
     def prepare_data(self):
         """load and prepare data for plotting"""
+        import pandas as pd
+
         with open(self.input_file, 'r') as f:
             data = json.load(f)
         
@@ -32,6 +33,8 @@ class ReelVisualizer:
     
     def create_plot(self, df):
         """create plotly scatter plot"""
+        import plotly.express as px
+
         fig = px.scatter(
             df,
             x='compound_sentiment',
@@ -2,16 +2,23 @@ import json
 import re
 from statistics import mean
 from pathlib import Path
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from langdetect import detect, LangDetectException
+# vaderSentiment and langdetect are imported on first use - keeps startup fast
 
 class VADERAnalyzer:
     def __init__(self):
-        """set vader analyzer and initialize variables"""
-        self.analyzer = SentimentIntensityAnalyzer()
+        """initialize variables - vader lexicon is loaded on first use"""
+        self._analyzer = None
         self.raw_data = None
         self.results = {}
 
+    @property
+    def analyzer(self):
+        """build vader analyzer (loads lexicon) the first time it is needed"""
+        if self._analyzer is None:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            self._analyzer = SentimentIntensityAnalyzer()
+        return self._analyzer
+
     def clean_text(self, text):
         """pre-process raw textual data - makes for better vader analysis"""
         text = re.sub(r'@[^\s]+', '', text)  # remove account mentions
@@ -21,6 +28,8 @@ class VADERAnalyzer:
 
     def is_english(self, text):
         """check if text is English"""
+        from langdetect import detect, LangDetectException
+
         if not text.strip():  # skip empty strings
             return False
             